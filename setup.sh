@@ -190,8 +190,10 @@ create_cron_job() {
     if [[ $REPLY =~ ^[Jj]$ ]]; then
         print_color "blue" "Erstelle Cron-Job..."
         
-        # Cron-Job hinzufügen (alle 10 Stunden)
-        (crontab -l 2>/dev/null; echo "0 */10 * * * /usr/bin/python3 $SERVER_DIR/updater.py once >> $SERVER_DIR/updater.log 2>&1") | crontab -
+        # Cron-Job hinzufügen (alle 10 Stunden), alte updater.py-Einträge vorher entfernen
+        # Der Updater schreibt selbst in updater.log - Konsolenausgabe (stdout) verwerfen,
+        # Abstürze vor dem Logging-Start (stderr) in updater_error.log festhalten
+        (crontab -l 2>/dev/null | grep -v "updater.py"; echo "0 */10 * * * /usr/bin/python3 $SERVER_DIR/updater.py once > /dev/null 2>> $SERVER_DIR/updater_error.log") | crontab -
         
         print_color "green" "✓ Cron-Job erstellt (alle 10 Stunden)"
     fi
@@ -91,8 +91,8 @@ echo ""
 read -p "Möchten Sie die Update-Logs entfernen? (j/n): " -n 1 -r
 echo
 if [[ $REPLY =~ ^[Jj]$ ]]; then
-    if [ -f "$SERVER_DIR/updater.log" ]; then
-        rm "$SERVER_DIR/updater.log"
+    if compgen -G "$SERVER_DIR/updater.log*" > /dev/null || [ -f "$SERVER_DIR/updater_error.log" ]; then
+        rm -f "$SERVER_DIR"/updater.log "$SERVER_DIR"/updater.log.* "$SERVER_DIR"/updater_error.log
         print_color "green" "✓ Update-Log entfernt"
     fi
     
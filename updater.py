@@ -11,9 +11,17 @@ import json
 import time
 import shutil
 import hashlib
+import copy
+import fcntl
+import atexit
+import signal
 import logging
+import logging.handlers
+import queue
 import requests
 import subprocess
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -28,7 +36,13 @@ CONFIG = {
     "check_interval": 36000,  # 10 Stunden in Sekunden
     "log_file": "/home/zfzfg/minecraftserver/purpur2/updater.log",
     "state_file": "/home/zfzfg/minecraftserver/purpur2/updater_state.json",
-    "debug_mode": True  # Debug-Modus für detaillierte Ausgaben
+    "debug_mode": True,  # Debug-Modus für detaillierte Ausgaben
+    "log_rotation": "size",  # "size" (nach Dateigröße) oder "time" (nach Zeitpunkt)
+    "log_max_bytes": 10 * 1024 * 1024,  # Maximale Log-Größe bei "size" (10 MB)
+    "log_rotation_when": "midnight",  # Rotationszeitpunkt bei "time" (siehe TimedRotatingFileHandler)
+    "log_backup_count": 5,  # Anzahl aufbewahrter rotierter Log-Dateien
+    "log_json": False,  # Log-Datei als JSON-Lines mit Plugin-Kontextfeldern schreiben
+    "log_console": True  # Zusätzliche Ausgabe auf stdout
 }
 
 # Plugin-Liste mit Modrinth-IDs
@@ -60,14 +74,163 @@ SPIGOT_PLUGINS = {
 }
 
 # Logging-Setup
-logging.basicConfig(
-    level=logging.DEBUG if CONFIG.get("debug_mode") else logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(CONFIG["log_file"]),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Plugin-Kontext des aktuellen Threads (wird in jeden Log-Record übernommen)
+_log_context: ContextVar[Dict[str, str]] = ContextVar("log_context", default={})
+
+
+@contextmanager
+def plugin_log_context(plugin: str, source: str):
+    """Setzt Plugin-Kontextfelder für alle Log-Einträge innerhalb des Blocks"""
+    token = _log_context.set({"plugin": plugin, "source": source})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class PluginContextFilter(logging.Filter):
+    """Überträgt den Plugin-Kontext in den Log-Record (läuft im aufrufenden Thread)"""
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        record.plugin = context.get("plugin")
+        record.source = context.get("source")
+        return True
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formatiert Log-Einträge als JSON-Lines"""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+        for field in ("plugin", "source"):
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler, der Traceback und Kontext getrennt von der Nachricht übergibt
+
+    Die Nachricht wird im aufrufenden Thread zusammengesetzt (die Argumente
+    könnten sich sonst bis zur Ausgabe ändern), der Traceback landet als
+    Text in exc_text statt in der Nachricht.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+# Hält die Rotations-Sperre für die gesamte Prozesslaufzeit
+_log_lock_file = None
+
+
+def acquire_rotation_lock() -> bool:
+    """Versucht exklusiv das Recht zur Log-Rotation zu erhalten
+
+    Mehrere Updater-Prozesse (Daemon, Cron, 'once' aus start_minecraft.sh)
+    schreiben in dieselbe Log-Datei. Nur der Prozess mit der Sperre rotiert,
+    alle anderen hängen nur an.
+    """
+    global _log_lock_file
+    lock_file = open(CONFIG["log_file"] + ".lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _log_lock_file = lock_file
+    return True
+
+
+def log_uncaught_exception(exc_type, exc_value, exc_traceback):
+    """Schreibt unbehandelte Ausnahmen ins Log statt nur auf stderr"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+    logging.getLogger(__name__).critical(
+        "Unbehandelter Fehler", exc_info=(exc_type, exc_value, exc_traceback)
+    )
+
+
+def handle_sigterm(signum, frame):
+    """Beendet den Prozess regulär, damit atexit die Log-Queue leert (systemctl stop)"""
+    logging.getLogger(__name__).info("SIGTERM empfangen, beende Updater")
+    sys.exit(0)
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Richtet nicht-blockierendes Logging ein
+
+    Log-Aufrufe landen nur in einer Queue; ein Hintergrund-Thread schreibt
+    sie in die Log-Datei und auf die Konsole (stdout).
+    """
+    rotation = CONFIG.get("log_rotation", "size")
+    if rotation not in ("size", "time"):
+        raise ValueError(f"Ungültiger Wert für log_rotation: {rotation!r} (erlaubt: 'size', 'time')")
+    
+    if not acquire_rotation_lock():
+        # Ein anderer Prozess rotiert; nach dessen Rotation wird die Datei neu geöffnet
+        file_handler = logging.handlers.WatchedFileHandler(CONFIG["log_file"], encoding="utf-8")
+    elif rotation == "time":
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            CONFIG["log_file"],
+            when=CONFIG.get("log_rotation_when", "midnight"),
+            backupCount=CONFIG.get("log_backup_count", 5),
+            encoding="utf-8"
+        )
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            CONFIG["log_file"],
+            maxBytes=CONFIG.get("log_max_bytes", 10 * 1024 * 1024),
+            backupCount=CONFIG.get("log_backup_count", 5),
+            encoding="utf-8"
+        )
+    file_handler.setFormatter(
+        JsonLineFormatter() if CONFIG.get("log_json") else logging.Formatter(LOG_FORMAT)
+    )
+    handlers = [file_handler]
+    
+    if CONFIG.get("log_console", True):
+        # stdout, damit stderr nur echte Abstürze enthält (Cron leitet es separat um)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(console_handler)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(PluginContextFilter())
+    
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if CONFIG.get("debug_mode") else logging.INFO)
+    root.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Queue beim Beenden leeren, damit keine Einträge verloren gehen
+    atexit.register(listener.stop)
+    # Standard-SIGTERM beendet ohne atexit - ohne Handler gingen Einträge in der Queue verloren
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    sys.excepthook = log_uncaught_exception
+    return listener
+
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
 class MinecraftUpdater:
@@ -99,10 +262,10 @@ class MinecraftUpdater:
             try:
                 with open(CONFIG["state_file"], 'r') as f:
                     state = json.load(f)
-                    logger.debug(f"State geladen: {len(state.get('plugin_versions', {}))} Plugin-Versionen")
+                    logger.debug("State geladen: %s Plugin-Versionen", len(state.get('plugin_versions', {})))
                     return state
             except Exception as e:
-                logger.error(f"Fehler beim Laden des States: {e}")
+                logger.error("Fehler beim Laden des States: %s", e)
         return {"plugin_versions": {}, "plugin_hashes": {}, "plugin_files": {}, "purpur_hash": None}
     
     def save_state(self):
@@ -110,9 +273,9 @@ class MinecraftUpdater:
         try:
             with open(CONFIG["state_file"], 'w') as f:
                 json.dump(self.state, f, indent=2)
-            logger.debug(f"State gespeichert: {len(self.state['plugin_versions'])} Plugins")
+            logger.debug("State gespeichert: %s Plugins", len(self.state['plugin_versions']))
         except Exception as e:
-            logger.error(f"Fehler beim Speichern des States: {e}")
+            logger.error("Fehler beim Speichern des States: %s", e)
     
     def get_file_hash(self, filepath: str) -> Optional[str]:
         """Berechnet SHA256-Hash einer Datei"""
@@ -123,7 +286,7 @@ class MinecraftUpdater:
                     sha256_hash.update(byte_block)
             return sha256_hash.hexdigest()
         except Exception as e:
-            logger.error(f"Fehler beim Hash-Berechnen von {filepath}: {e}")
+            logger.error("Fehler beim Hash-Berechnen von %s: %s", filepath, e)
             return None
     
     def find_plugin_file(self, plugin_name: str) -> Optional[str]:
@@ -145,14 +308,14 @@ class MinecraftUpdater:
                 for name in possible_names:
                     if name in file_lower:
                         full_path = os.path.join(CONFIG["plugins_dir"], file)
-                        logger.debug(f"Plugin-Datei gefunden für {plugin_name}: {file}")
+                        logger.debug("Plugin-Datei gefunden für %s: %s", plugin_name, file)
                         return full_path
             
-            logger.debug(f"Keine Plugin-Datei gefunden für {plugin_name}")
+            logger.debug("Keine Plugin-Datei gefunden für %s", plugin_name)
             return None
             
         except Exception as e:
-            logger.error(f"Fehler beim Suchen der Plugin-Datei für {plugin_name}: {e}")
+            logger.error("Fehler beim Suchen der Plugin-Datei für %s: %s", plugin_name, e)
             return None
     
     def backup_plugin(self, plugin_path: str) -> Optional[str]:
@@ -163,10 +326,10 @@ class MinecraftUpdater:
             backup_name = f"{timestamp}_{filename}"
             backup_path = os.path.join(CONFIG["plugins_old_dir"], backup_name)
             shutil.copy2(plugin_path, backup_path)
-            logger.info(f"Plugin gesichert: {backup_name}")
+            logger.info("Plugin gesichert: %s", backup_name)
             return backup_path
         except Exception as e:
-            logger.error(f"Fehler beim Backup von {plugin_path}: {e}")
+            logger.error("Fehler beim Backup von %s: %s", plugin_path, e)
             return None
     
     def restore_plugin(self, backup_path: str, plugin_name: str) -> bool:
@@ -181,10 +344,10 @@ class MinecraftUpdater:
             
             restore_path = os.path.join(CONFIG["plugins_dir"], filename)
             shutil.copy2(backup_path, restore_path)
-            logger.info(f"Plugin wiederhergestellt: {plugin_name} -> {filename}")
+            logger.info("Plugin wiederhergestellt: %s -> %s", plugin_name, filename)
             return True
         except Exception as e:
-            logger.error(f"Fehler beim Wiederherstellen von {plugin_name}: {e}")
+            logger.error("Fehler beim Wiederherstellen von %s: %s", plugin_name, e)
             return False
     
     def log_error(self, plugin_name: str, error_msg: str, plugin_path: str = None):
@@ -205,9 +368,9 @@ class MinecraftUpdater:
                 error_plugin = os.path.join(CONFIG["plugin_errors_dir"], 
                                            f"{timestamp}_{os.path.basename(plugin_path)}")
                 shutil.move(plugin_path, error_plugin)
-                logger.error(f"Fehlerhaftes Plugin verschoben: {error_plugin}")
+                logger.error("Fehlerhaftes Plugin verschoben: %s", error_plugin)
         except Exception as e:
-            logger.error(f"Fehler beim Error-Logging für {plugin_name}: {e}")
+            logger.error("Fehler beim Error-Logging für %s: %s", plugin_name, e)
     
     def update_purpur(self) -> bool:
         """Updated den Purpur-Server"""
@@ -236,13 +399,13 @@ class MinecraftUpdater:
                     backup_path = os.path.join(CONFIG["server_path"], 
                                               f"purpur_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jar")
                     shutil.copy2(old_jar, backup_path)
-                    logger.debug(f"Purpur-Backup erstellt: {backup_path}")
+                    logger.debug("Purpur-Backup erstellt: %s", backup_path)
                 
                 # Ersetze mit neuer Version
                 shutil.move(temp_path, old_jar)
                 self.state["purpur_hash"] = new_hash
                 self.save_state()
-                logger.info(f"Purpur erfolgreich auf Version {CONFIG['minecraft_version']} aktualisiert")
+                logger.info("Purpur erfolgreich auf Version %s aktualisiert", CONFIG['minecraft_version'])
                 return True
             else:
                 os.remove(temp_path)
@@ -250,7 +413,7 @@ class MinecraftUpdater:
                 return False
                 
         except Exception as e:
-            logger.error(f"Fehler beim Purpur-Update: {e}")
+            logger.error("Fehler beim Purpur-Update: %s", e)
             if os.path.exists(temp_path):
                 os.remove(temp_path)
             return False
@@ -274,28 +437,28 @@ class MinecraftUpdater:
             if versions:
                 # Nimm die neueste Version
                 latest = versions[0]
-                logger.debug(f"Modrinth neueste Version für {project_id}: {latest.get('name', 'unbekannt')}")
+                logger.debug("Modrinth neueste Version für %s: %s", project_id, latest.get('name', 'unbekannt'))
                 return latest
             return None
             
         except Exception as e:
-            logger.error(f"Fehler beim Abrufen der Modrinth-Version für {project_id}: {e}")
+            logger.error("Fehler beim Abrufen der Modrinth-Version für %s: %s", project_id, e)
             return None
     
     def download_modrinth_plugin(self, plugin_name: str, project_id: str) -> bool:
         """Lädt ein Plugin von Modrinth herunter"""
         try:
-            logger.debug(f"Prüfe Modrinth-Plugin: {plugin_name} ({project_id})")
+            logger.debug("Prüfe Modrinth-Plugin: %s (%s)", plugin_name, project_id)
             
             version_info = self.get_modrinth_version(project_id)
             if not version_info:
-                logger.warning(f"Keine Version für {plugin_name} gefunden")
+                logger.warning("Keine Version für %s gefunden", plugin_name)
                 return False
             
             # Version-ID und Dateiname extrahieren
             version_id = version_info['id']
             if not version_info.get('files'):
-                logger.warning(f"Keine Dateien für {plugin_name} verfügbar")
+                logger.warning("Keine Dateien für %s verfügbar", plugin_name)
                 return False
             
             download_url = version_info['files'][0]['url']
@@ -306,13 +469,13 @@ class MinecraftUpdater:
             current_version = self.state["plugin_versions"].get(plugin_name)
             current_file = self.find_plugin_file(plugin_name)
             
-            logger.debug(f"{plugin_name}: Aktuelle Version={current_version}, Neue Version={version_id}")
+            logger.debug("%s: Aktuelle Version=%s, Neue Version=%s", plugin_name, current_version, version_id)
             
             # Prüfe ob Plugin bereits aktuell ist
             if current_version == version_id and current_file:
                 current_hash = self.get_file_hash(current_file)
                 if current_hash == file_hash or current_hash == self.state["plugin_hashes"].get(plugin_name):
-                    logger.info(f"{plugin_name} ist bereits aktuell (Version: {version_id})")
+                    logger.info("%s ist bereits aktuell (Version: %s)", plugin_name, version_id)
                     return False
             
             # Backup existierendes Plugin
@@ -323,7 +486,7 @@ class MinecraftUpdater:
                     os.remove(current_file)
             
             # Download neues Plugin
-            logger.info(f"Lade {plugin_name} herunter: {filename}")
+            logger.info("Lade %s herunter: %s", plugin_name, filename)
             plugin_path = os.path.join(CONFIG["plugins_dir"], filename)
             
             response = self.session.get(download_url, stream=True, timeout=60)
@@ -348,12 +511,12 @@ class MinecraftUpdater:
             self.state["plugin_files"][plugin_name] = filename
             self.save_state()
             
-            logger.info(f"✓ {plugin_name} erfolgreich aktualisiert: {filename}")
-            logger.debug(f"  Version: {version_id}, Hash: {downloaded_hash[:16]}...")
+            logger.info("✓ %s erfolgreich aktualisiert: %s", plugin_name, filename)
+            logger.debug("  Version: %s, Hash: %.16s...", version_id, downloaded_hash)
             return True
             
         except Exception as e:
-            logger.error(f"Fehler beim Download von {plugin_name}: {e}")
+            logger.error("Fehler beim Download von %s: %s", plugin_name, e)
             
             # Wiederherstellen bei Fehler
             if backup_path and os.path.exists(backup_path):
@@ -365,7 +528,7 @@ class MinecraftUpdater:
     def download_spigot_plugin(self, plugin_name: str, resource_id: str) -> bool:
         """Lädt ein Plugin von SpigotMC herunter mit Hash-basierter Versionsprüfung"""
         try:
-            logger.debug(f"Prüfe SpigotMC-Plugin: {plugin_name} ({resource_id})")
+            logger.debug("Prüfe SpigotMC-Plugin: %s (%s)", plugin_name, resource_id)
             
             # Finde aktuelle Plugin-Datei
             current_file = self.find_plugin_file(plugin_name)
@@ -373,7 +536,7 @@ class MinecraftUpdater:
             
             if current_file:
                 current_hash = self.get_file_hash(current_file)
-                logger.debug(f"{plugin_name}: Aktueller Hash={current_hash[:16] if current_hash else 'None'}...")
+                logger.debug("%s: Aktueller Hash=%.16s...", plugin_name, current_hash)
             
             # SpigotMC erfordert Spiget API
             # Hole zuerst Version-Info
@@ -382,7 +545,7 @@ class MinecraftUpdater:
                 version_response = self.session.get(version_url, timeout=30)
                 version_data = version_response.json() if version_response.status_code == 200 else {}
                 version_name = version_data.get('name', 'unbekannt')
-                logger.debug(f"{plugin_name}: Neueste Version={version_name}")
+                logger.debug("%s: Neueste Version=%s", plugin_name, version_name)
             except:
                 version_name = "unbekannt"
             
@@ -392,7 +555,7 @@ class MinecraftUpdater:
             # Temporärer Download zum Hash-Vergleich
             temp_path = os.path.join(CONFIG["plugins_dir"], f"{plugin_name}_temp.jar")
             
-            logger.info(f"Lade {plugin_name} von SpigotMC herunter...")
+            logger.info("Lade %s von SpigotMC herunter...", plugin_name)
             response = self.session.get(download_url, stream=True, allow_redirects=True, timeout=60)
             response.raise_for_status()
             
@@ -403,7 +566,7 @@ class MinecraftUpdater:
             # Prüfe Download
             if os.path.getsize(temp_path) < 1024:
                 os.remove(temp_path)
-                logger.warning(f"{plugin_name}: Download zu klein, überspringe")
+                logger.warning("%s: Download zu klein, überspringe", plugin_name)
                 return False
             
             # Berechne Hash der neuen Datei
@@ -412,13 +575,13 @@ class MinecraftUpdater:
                 os.remove(temp_path)
                 return False
             
-            logger.debug(f"{plugin_name}: Neuer Hash={new_hash[:16]}...")
+            logger.debug("%s: Neuer Hash=%.16s...", plugin_name, new_hash)
             
             # Vergleiche Hashes
             stored_hash = self.state["plugin_hashes"].get(plugin_name)
             if new_hash == current_hash or new_hash == stored_hash:
                 os.remove(temp_path)
-                logger.info(f"{plugin_name} ist bereits aktuell (Hash unverändert)")
+                logger.info("%s ist bereits aktuell (Hash unverändert)", plugin_name)
                 return False
             
             # Backup existierendes Plugin
@@ -439,12 +602,12 @@ class MinecraftUpdater:
             self.state["plugin_versions"][plugin_name] = f"hash_{new_hash[:16]}"
             self.save_state()
             
-            logger.info(f"✓ {plugin_name} erfolgreich von SpigotMC aktualisiert")
-            logger.debug(f"  Neuer Hash: {new_hash[:16]}...")
+            logger.info("✓ %s erfolgreich von SpigotMC aktualisiert", plugin_name)
+            logger.debug("  Neuer Hash: %.16s...", new_hash)
             return True
             
         except Exception as e:
-            logger.error(f"Fehler beim SpigotMC-Download von {plugin_name}: {e}")
+            logger.error("Fehler beim SpigotMC-Download von %s: %s", plugin_name, e)
             
             # Cleanup
             if os.path.exists(temp_path):
@@ -467,20 +630,20 @@ class MinecraftUpdater:
             # Prüfe Dateigröße (sollte > 1KB sein)
             size = os.path.getsize(plugin_path)
             if size < 1024:
-                logger.debug(f"Plugin zu klein: {plugin_path} ({size} bytes)")
+                logger.debug("Plugin zu klein: %s (%s bytes)", plugin_path, size)
                 return False
             
             # Prüfe ob es eine JAR-Datei ist (Magic Bytes)
             with open(plugin_path, 'rb') as f:
                 magic = f.read(4)
                 if magic[:2] != b'PK':  # ZIP/JAR Magic Bytes
-                    logger.debug(f"Keine gültige JAR-Datei: {plugin_path}")
+                    logger.debug("Keine gültige JAR-Datei: %s", plugin_path)
                     return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Fehler bei Plugin-Verifizierung {plugin_path}: {e}")
+            logger.error("Fehler bei Plugin-Verifizierung %s: %s", plugin_path, e)
             return False
     
     def clean_old_backups(self, keep_count: int = 3):
@@ -500,10 +663,10 @@ class MinecraftUpdater:
                 # Lösche alte Backups
                 for backup_path, _ in backups[keep_count:]:
                     os.remove(backup_path)
-                    logger.debug(f"Altes Backup gelöscht: {os.path.basename(backup_path)}")
+                    logger.debug("Altes Backup gelöscht: %s", os.path.basename(backup_path))
                     
         except Exception as e:
-            logger.error(f"Fehler beim Bereinigen der Backups: {e}")
+            logger.error("Fehler beim Bereinigen der Backups: %s", e)
     
     def update_all_plugins(self):
         """Aktualisiert alle konfigurierten Plugins"""
@@ -513,32 +676,34 @@ class MinecraftUpdater:
         fail_count = 0
         
         # Modrinth-Plugins
-        logger.info(f"Prüfe {len(MODRINTH_PLUGINS)} Modrinth-Plugins...")
+        logger.info("Prüfe %s Modrinth-Plugins...", len(MODRINTH_PLUGINS))
         for plugin_name, project_id in MODRINTH_PLUGINS.items():
             try:
-                if self.download_modrinth_plugin(plugin_name, project_id):
-                    success_count += 1
+                with plugin_log_context(plugin_name, "modrinth"):
+                    if self.download_modrinth_plugin(plugin_name, project_id):
+                        success_count += 1
                 time.sleep(1)  # Rate-Limiting
             except Exception as e:
-                logger.error(f"Unerwarteter Fehler bei {plugin_name}: {e}")
+                logger.error("Unerwarteter Fehler bei %s: %s", plugin_name, e)
                 fail_count += 1
         
         # SpigotMC-Plugins
-        logger.info(f"Prüfe {len(SPIGOT_PLUGINS)} SpigotMC-Plugins...")
+        logger.info("Prüfe %s SpigotMC-Plugins...", len(SPIGOT_PLUGINS))
         for plugin_name, resource_id in SPIGOT_PLUGINS.items():
             try:
-                if self.download_spigot_plugin(plugin_name, resource_id):
-                    success_count += 1
+                with plugin_log_context(plugin_name, "spigotmc"):
+                    if self.download_spigot_plugin(plugin_name, resource_id):
+                        success_count += 1
                 time.sleep(1)  # Rate-Limiting
             except Exception as e:
-                logger.error(f"Unerwarteter Fehler bei {plugin_name}: {e}")
+                logger.error("Unerwarteter Fehler bei %s: %s", plugin_name, e)
                 fail_count += 1
         
         # Bereinige alte Backups
         self.clean_old_backups()
         
         self.save_state()
-        logger.info(f"=== Plugin-Updates abgeschlossen: {success_count} aktualisiert, {fail_count} Fehler ===")
+        logger.info("=== Plugin-Updates abgeschlossen: %s aktualisiert, %s Fehler ===", success_count, fail_count)
     
     def is_server_running(self) -> bool:
         """Prüft ob der Minecraft-Server läuft"""
@@ -558,7 +723,7 @@ class MinecraftUpdater:
             for i in range(60):  # Max 60 Sekunden warten
                 time.sleep(1)
                 if not self.is_server_running():
-                    logger.info(f"Server nach {i+1} Sekunden gestoppt")
+                    logger.info("Server nach %s Sekunden gestoppt", i+1)
                     break
             else:
                 logger.warning("Server konnte nicht rechtzeitig gestoppt werden")
@@ -570,7 +735,7 @@ class MinecraftUpdater:
         if os.path.exists(start_script):
             subprocess.run(['bash', start_script])
         else:
-            logger.error(f"Start-Skript nicht gefunden: {start_script}")
+            logger.error("Start-Skript nicht gefunden: %s", start_script)
     
     def run_update_cycle(self):
         """Führt einen kompletten Update-Zyklus durch"""
@@ -578,9 +743,9 @@ class MinecraftUpdater:
         start_time = time.time()
         
         # Zeige aktuellen State
-        logger.info(f"Aktueller State: {len(self.state['plugin_versions'])} Plugins registriert")
-        if CONFIG.get("debug_mode"):
-            logger.debug(f"Registrierte Plugins: {list(self.state['plugin_versions'].keys())}")
+        logger.info("Aktueller State: %s Plugins registriert", len(self.state['plugin_versions']))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registrierte Plugins: %s", list(self.state['plugin_versions'].keys()))
         
         # Stoppe Server wenn nötig
         was_running = self.is_server_running()
@@ -596,7 +761,7 @@ class MinecraftUpdater:
             self.start_server()
         
         elapsed = time.time() - start_time
-        logger.info(f"=== Update-Zyklus abgeschlossen in {elapsed:.1f} Sekunden ===")
+        logger.info("=== Update-Zyklus abgeschlossen in %.1f Sekunden ===", elapsed)
     
     def reset_state(self):
         """Setzt den State zurück (für Neuinitialisierung)"""
@@ -608,14 +773,14 @@ class MinecraftUpdater:
     def run_daemon(self):
         """Läuft als Daemon und prüft regelmäßig auf Updates"""
         logger.info("Updater-Daemon gestartet")
-        logger.info(f"Update-Intervall: {CONFIG['check_interval']} Sekunden ({CONFIG['check_interval']/3600:.1f} Stunden)")
+        logger.info("Update-Intervall: %s Sekunden (%.1f Stunden)", CONFIG['check_interval'], CONFIG['check_interval']/3600)
         
         # Initiale Prüfung beim Start
         self.run_update_cycle()
         
         # Endlosschleife für regelmäßige Prüfungen
         while True:
-            logger.info(f"Nächste Prüfung in {CONFIG['check_interval']/3600:.1f} Stunden...")
+            logger.info("Nächste Prüfung in %.1f Stunden...", CONFIG['check_interval']/3600)
             time.sleep(CONFIG["check_interval"])
             self.run_update_cycle()
 